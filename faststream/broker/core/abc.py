@@ -78,7 +78,10 @@ class ABCBroker(Generic[MsgType]):
     ) -> "PublisherProto[MsgType]":
         publisher.add_prefix(self.prefix)
         key = hash(publisher)
-        publisher = self._publishers.get(key, publisher)
+
+        if (registered := self._publishers.get(key)) is not None:
+            return registered
+
         self._publishers = {**self._publishers, key: publisher}
         return publisher
 
@@ -142,7 +145,7 @@ class ABCBroker(Generic[MsgType]):
             self.include_router(r)
 
     def _solve_include_in_schema(self, include_in_schema: bool) -> bool:
-        if self.include_in_schema is None or self.include_in_schema:
+        if (router_include := self.include_in_schema) is None or router_include:
             return include_in_schema
         else:
-            return self.include_in_schema
+            return router_include
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import math
 from abc import abstractmethod
 from contextlib import suppress
@@ -19,7 +20,8 @@ from typing import (
 import anyio
 from redis.asyncio.client import PubSub as RPubSub
 from redis.asyncio.client import Redis
-from redis.exceptions import ResponseError
+from redis.exceptions import RedisError, ResponseError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 from typing_extensions import TypeAlias, override
 
 from faststream.broker.publisher.fake import FakePublisher
@@ -61,6 +63,10 @@ if TYPE_CHECKING:
 TopicName: TypeAlias = bytes
 Offset: TypeAlias = bytes
 
+# Redis < 7.0 truncates sub-millisecond BLPOP timeouts to 0 (block forever),
+# so shorter intervals are served by a non-blocking LPOP instead
+MIN_BLOCK_TIMEOUT = 0.001
+
 
 class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
     """A class to represent a Redis handler."""
@@ -420,22 +426,29 @@ class _ListHandlerMixin(LogicSubscriber):
             not self.calls
         ), "You can't use `get_one` method if subscriber has registered handlers."
 
-        sleep_interval = timeout / 10
-        raw_message = None
+        data: Optional[bytes] = None
 
-        with anyio.move_on_after(timeout):
-            while (  # noqa: ASYNC110
-                raw_message := await self._client.lpop(name=self.list_sub.name)
-            ) is None:
-                await anyio.sleep(sleep_interval)
+        if timeout < MIN_BLOCK_TIMEOUT:
+            data = await self._client.lpop(name=self.list_sub.name)
 
-        if not raw_message:
+        else:
+            # `socket_timeout` shorter than `timeout` breaks the blocking read
+            with suppress(RedisTimeoutError):
+                raw_message = await self._client.blpop(
+                    self.list_sub.name,
+                    timeout=timeout,
+                )
+
+                if raw_message:
+                    _, data = raw_message
+
+        if not data:
             return None
 
         msg: RedisListMessage = await process_msg(  # type: ignore[assignment]
             msg=DefaultListMessage(
                 type="list",
-                data=raw_message,
+                data=data,
                 channel=self.list_sub.name,
             ),
             middlewares=self._broker_middlewares,  # type: ignore[arg-type]
@@ -484,20 +497,31 @@ class ListSubscriber(_ListHandlerMixin):
         )
 
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
-        raw_msg = await client.lpop(name=self.list_sub.name)
+        polling_interval = self.list_sub.polling_interval
 
-        if raw_msg:
+        data: Optional[bytes]
+        if polling_interval < MIN_BLOCK_TIMEOUT:
+            data = await client.lpop(name=self.list_sub.name)
+
+            if not data:
+                await anyio.sleep(polling_interval)
+
+        else:
+            raw_msg = await client.blpop(
+                self.list_sub.name,
+                timeout=polling_interval,
+            )
+            data = raw_msg[1] if raw_msg else None
+
+        if data:
             msg = DefaultListMessage(
                 type="list",
-                data=raw_msg,
+                data=data,
                 channel=self.list_sub.name,
             )
 
             await self.consume(msg)  # type: ignore[arg-type]
 
-        else:
-            await anyio.sleep(self.list_sub.polling_interval)
-
 
 class BatchListSubscriber(_ListHandlerMixin):
     def __init__(
@@ -533,10 +557,20 @@ class BatchListSubscriber(_ListHandlerMixin):
         )
 
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
-        raw_msgs = await client.lpop(
-            name=self.list_sub.name,
-            count=self.list_sub.max_records,
-        )
+        polling_interval = self.list_sub.polling_interval
+
+        raw_msgs: Optional[List[bytes]]
+        if polling_interval < MIN_BLOCK_TIMEOUT:
+            raw_msgs = await client.lpop(
+                name=self.list_sub.name,
+                count=self.list_sub.max_records,
+            )
+
+            if not raw_msgs:
+                await anyio.sleep(polling_interval)
+
+        else:
+            raw_msgs = await self._blocking_pop_batch(client, polling_interval)
 
         if raw_msgs:
             msg = BatchListMessage(
@@ -547,8 +581,41 @@ class BatchListSubscriber(_ListHandlerMixin):
 
             await self.consume(msg)  # type: ignore[arg-type]
 
-        else:
-            await anyio.sleep(self.list_sub.polling_interval)
+    async def _blocking_pop_batch(
+        self,
+        client: "Redis[bytes]",
+        timeout: float,
+    ) -> Optional[List[bytes]]:
+        """Block until the first message arrives, then drain the rest of the batch."""
+        raw_msg = await client.blpop(self.list_sub.name, timeout=timeout)
+
+        if not raw_msg:
+            return None
+
+        _, data = raw_msg
+        raw_msgs = [data]
+
+        if self.list_sub.max_records > 1:
+            try:
+                raw_msgs.extend(
+                    await client.lpop(
+                        name=self.list_sub.name,
+                        count=self.list_sub.max_records - 1,
+                    )
+                    or ()
+                )
+
+            except RedisError as e:
+                # BLPOP already removed the first message from the list,
+                # so it has to be consumed even if draining fails
+                self._log(
+                    logging.ERROR,
+                    "Failed to drain list batch, consuming already popped messages",
+                    extra=self.get_log_context(None),
+                    exc_info=e,
+                )
+
+        return raw_msgs
 
 
 class _StreamHandlerMixin(LogicSubscriber):
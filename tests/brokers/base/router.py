@@ -667,3 +667,13 @@ class RouterLocalTestcase(RouterTestcase):
             await pub_broker.start()
             await pub_broker.publish("hello", queue)
             publisher.mock.assert_called_with("response")
+
+    async def test_publisher_registered_once(
+        self,
+        router: BrokerRouter,
+        queue: str,
+    ):
+        publisher = router.publisher(queue)
+
+        assert router.publisher(queue) is publisher
+        assert len(router._publishers) == 1
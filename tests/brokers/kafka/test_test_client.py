@@ -25,6 +25,27 @@ class TestTestclient(BrokerTestclientTestcase):
     def get_fake_producer_class(self) -> type:
         return FakeProducer
 
+    async def test_publisher_registered_once_on_running_broker(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        async with self.patch_broker(broker) as br:
+            publisher = br.publisher(queue)
+
+            with patch.object(
+                KafkaBroker,
+                "setup_publisher",
+                spy_decorator(KafkaBroker.setup_publisher),
+            ) as m:
+                assert br.publisher(queue) is publisher
+
+            m.mock.assert_called_once()
+            assert len(br._publishers) == 1
+
+            await publisher.publish("hello")
+
     async def test_partition_match(
         self,
         queue: str,
@@ -1,13 +1,26 @@
 import asyncio
-from typing import List
-from unittest.mock import MagicMock, patch
+from typing import Any, Awaitable, Callable, List, Union
+from unittest.mock import MagicMock
 
 import pytest
 from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from faststream.redis import ListSub, PubSub, RedisBroker, RedisMessage, StreamSub
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
-from tests.tools import spy_decorator
+
+
+class XackCounter:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.calls = 0
+
+        xack = Redis.xack
+
+        async def counted_xack(*args: Any, **kwargs: Any) -> Any:
+            self.calls += 1
+            return await xack(*args, **kwargs)
+
+        monkeypatch.setattr(Redis, "xack", counted_xack)
 
 
 @pytest.mark.redis
@@ -32,13 +45,8 @@ class TestConsume(BrokerRealConsumeTestcase):
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br._connection.publish(queue, "hello")),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            await br._connection.publish(queue, "hello")
+            await asyncio.wait_for(event.wait(), timeout=3)
 
         mock.assert_called_once_with(b"hello")
 
@@ -57,13 +65,8 @@ class TestConsume(BrokerRealConsumeTestcase):
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br.publish("hello", "test.name")),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            await br.publish("hello", "test.name")
+            await asyncio.wait_for(event.wait(), timeout=3)
 
         mock.assert_called_once_with("hello")
 
@@ -82,13 +85,8 @@ class TestConsume(BrokerRealConsumeTestcase):
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br.publish("hello", "test.name")),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            await br.publish("hello", "test.name")
+            await asyncio.wait_for(event.wait(), timeout=3)
 
         mock.assert_called_once_with("hello")
 
@@ -96,21 +94,48 @@ class TestConsume(BrokerRealConsumeTestcase):
 @pytest.mark.redis
 @pytest.mark.asyncio
 class TestConsumeList:
-    def get_broker(self, apply_types: bool = False):
-        return RedisBroker(apply_types=apply_types)
+    def get_broker(self, apply_types: bool = False, **kwargs):
+        return RedisBroker(apply_types=apply_types, **kwargs)
 
     def patch_broker(self, broker):
         return broker
 
+    @pytest.mark.parametrize(
+        ("get_list", "publish", "expected"),
+        [
+            pytest.param(
+                lambda queue: queue,
+                lambda br, queue: br.publish("hello", list=queue),
+                "hello",
+                id="publish",
+            ),
+            pytest.param(
+                lambda queue: queue,
+                lambda br, queue: br._connection.rpush(queue, "hello"),
+                b"hello",
+                id="native",
+            ),
+            pytest.param(
+                lambda queue: ListSub(queue, batch=True),
+                lambda br, queue: br.publish("hi", list=queue),
+                ["hi"],
+                id="batch with one",
+                marks=pytest.mark.slow,
+            ),
+        ],
+    )
     async def test_consume_list(
         self,
         event: asyncio.Event,
         queue: str,
         mock: MagicMock,
+        get_list: Callable[[str], Union[str, ListSub]],
+        publish: Callable[[RedisBroker, str], Awaitable[Any]],
+        expected: Any,
     ):
         consume_broker = self.get_broker()
 
-        @consume_broker.subscriber(list=queue)
+        @consume_broker.subscriber(list=get_list(queue))
         async def handler(msg):
             mock(msg)
             event.set()
@@ -118,23 +143,19 @@ class TestConsumeList:
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br.publish("hello", list=queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            await publish(br, queue)
+            await asyncio.wait_for(event.wait(), timeout=3)
 
-        mock.assert_called_once_with("hello")
+        mock.assert_called_once_with(expected)
 
-    async def test_consume_list_native(
+    @pytest.mark.slow
+    async def test_consume_list_with_socket_timeout(
         self,
         event: asyncio.Event,
         queue: str,
         mock: MagicMock,
     ):
-        consume_broker = self.get_broker()
+        consume_broker = self.get_broker(socket_timeout=0.5)
 
         @consume_broker.subscriber(list=queue)
         async def handler(msg):
@@ -144,44 +165,47 @@ class TestConsumeList:
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br._connection.rpush(queue, "hello")),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            # stay idle longer than socket_timeout before publishing
+            await asyncio.sleep(1.0)
 
-        mock.assert_called_once_with(b"hello")
+            await br.publish("hello", list=queue)
+            await asyncio.wait_for(event.wait(), timeout=1)
+
+        mock.assert_called_once_with("hello")
 
     @pytest.mark.slow
-    async def test_consume_list_batch_with_one(
+    @pytest.mark.parametrize(
+        ("batch", "expected"),
+        [
+            pytest.param(False, "hello", id="single"),
+            pytest.param(True, ["hello"], id="batch"),
+        ],
+    )
+    async def test_consume_list_no_wait_with_socket_timeout(
         self,
-        queue: str,
         event: asyncio.Event,
-        mock,
+        queue: str,
+        mock: MagicMock,
+        batch: bool,
+        expected: Any,
     ):
-        consume_broker = self.get_broker()
+        consume_broker = self.get_broker(socket_timeout=0.5)
 
-        @consume_broker.subscriber(
-            list=ListSub(queue, batch=True, polling_interval=0.01)
-        )
+        @consume_broker.subscriber(list=ListSub(queue, batch=batch, polling_interval=0))
         async def handler(msg):
             mock(msg)
             event.set()
 
         async with self.patch_broker(consume_broker) as br:
             await br.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br.publish("hi", list=queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
 
-            assert event.is_set()
-            mock.assert_called_once_with(["hi"])
+            # `polling_interval=0` must not turn into an unbounded `BLPOP key 0`
+            await asyncio.sleep(1.0)
+
+            await br.publish("hello", list=queue)
+            await asyncio.wait_for(event.wait(), timeout=1)
+
+        mock.assert_called_once_with(expected)
 
     @pytest.mark.slow
     async def test_consume_list_batch_headers(
@@ -192,9 +216,7 @@ class TestConsumeList:
     ):
         consume_broker = self.get_broker(apply_types=True)
 
-        @consume_broker.subscriber(
-            list=ListSub(queue, batch=True, polling_interval=0.01)
-        )
+        @consume_broker.subscriber(list=ListSub(queue, batch=True))
         def subscriber(m, msg: RedisMessage):
             check = all(
                 (
@@ -209,15 +231,8 @@ class TestConsumeList:
 
         async with self.patch_broker(consume_broker) as br:
             await br.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(
-                        br.publish("", list=queue, headers={"custom": "1"})
-                    ),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            await br.publish("", list=queue, headers={"custom": "1"})
+            await asyncio.wait_for(event.wait(), timeout=3)
 
             assert event.is_set()
             mock.assert_called_once_with(True)
@@ -229,25 +244,20 @@ class TestConsumeList:
     ):
         consume_broker = self.get_broker(apply_types=True)
 
-        msgs_queue = asyncio.Queue(maxsize=1)
+        result = asyncio.get_running_loop().create_future()
 
-        @consume_broker.subscriber(
-            list=ListSub(queue, batch=True, polling_interval=0.01)
-        )
+        @consume_broker.subscriber(list=ListSub(queue, batch=True))
         async def handler(msg):
-            await msgs_queue.put(msg)
+            result.set_result(msg)
 
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
             await br.publish_batch(1, "hi", list=queue)
 
-            result, _ = await asyncio.wait(
-                (asyncio.create_task(msgs_queue.get()),),
-                timeout=3,
-            )
+            msgs = await asyncio.wait_for(result, timeout=3)
 
-            assert [{1, "hi"}] == [set(r.result()) for r in result]
+            assert {1, "hi"} == set(msgs)
 
     @pytest.mark.slow
     async def test_consume_list_batch_complex(
@@ -264,25 +274,20 @@ class TestConsumeList:
             def __hash__(self):
                 return hash(self.m)
 
-        msgs_queue = asyncio.Queue(maxsize=1)
+        result = asyncio.get_running_loop().create_future()
 
-        @consume_broker.subscriber(
-            list=ListSub(queue, batch=True, polling_interval=0.01)
-        )
+        @consume_broker.subscriber(list=ListSub(queue, batch=True))
         async def handler(msg: List[Data]):
-            await msgs_queue.put(msg)
+            result.set_result(msg)
 
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
             await br.publish_batch(Data(m="hi"), Data(m="again"), list=queue)
 
-            result, _ = await asyncio.wait(
-                (asyncio.create_task(msgs_queue.get()),),
-                timeout=3,
-            )
+            msgs = await asyncio.wait_for(result, timeout=3)
 
-        assert [{Data(m="hi"), Data(m="again")}] == [set(r.result()) for r in result]
+        assert {Data(m="hi"), Data(m="again")} == set(msgs)
 
     @pytest.mark.slow
     async def test_consume_list_batch_native(
@@ -291,25 +296,74 @@ class TestConsumeList:
     ):
         consume_broker = self.get_broker()
 
-        msgs_queue = asyncio.Queue(maxsize=1)
+        result = asyncio.get_running_loop().create_future()
 
-        @consume_broker.subscriber(
-            list=ListSub(queue, batch=True, polling_interval=0.01)
-        )
+        @consume_broker.subscriber(list=ListSub(queue, batch=True))
         async def handler(msg):
-            await msgs_queue.put(msg)
+            result.set_result(msg)
 
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
             await br._connection.rpush(queue, 1, "hi")
 
-            result, _ = await asyncio.wait(
-                (asyncio.create_task(msgs_queue.get()),),
-                timeout=3,
-            )
+            msgs = await asyncio.wait_for(result, timeout=3)
+
+        assert {1, "hi"} == set(msgs)
+
+    @pytest.mark.slow
+    async def test_consume_list_batch_max_records(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+    ):
+        consume_broker = self.get_broker()
+
+        consumed = []
+
+        @consume_broker.subscriber(list=ListSub(queue, batch=True, max_records=2))
+        async def handler(msg):
+            mock(msg)
+            consumed.extend(msg)
+            if len(consumed) == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
 
-        assert [{1, "hi"}] == [set(r.result()) for r in result]
+            await br.publish_batch(1, 2, 3, list=queue)
+            await asyncio.wait_for(event.wait(), timeout=3)
+
+        assert [c.args[0] for c in mock.call_args_list] == [[1, 2], [3]]
+
+    @pytest.mark.slow
+    async def test_consume_list_batch_drain_error(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(list=ListSub(queue, batch=True))
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async def broken_lpop(*args: Any, **kwargs: Any) -> Any:
+            raise RedisConnectionError
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            monkeypatch.setattr(Redis, "lpop", broken_lpop)
+
+            await br.publish("hi", list=queue)
+            await asyncio.wait_for(event.wait(), timeout=3)
+
+        mock.assert_called_once_with(["hi"])
 
     async def test_get_one(
         self,
@@ -356,83 +410,87 @@ class TestConsumeList:
             mock(await subscriber.get_one(timeout=1e-24))
             mock.assert_called_once_with(None)
 
-
-@pytest.mark.redis
-@pytest.mark.asyncio
-class TestConsumeStream:
-    def get_broker(self, apply_types: bool = False):
-        return RedisBroker(apply_types=apply_types)
-
-    def patch_broker(self, broker):
-        return broker
-
-    @pytest.mark.slow
-    async def test_consume_stream(
+    @pytest.mark.parametrize(
+        "timeout",
+        [
+            pytest.param(0, id="zero"),
+            pytest.param(0.0005, id="sub-millisecond"),
+        ],
+    )
+    async def test_get_one_no_wait(
         self,
-        event: asyncio.Event,
+        queue: str,
         mock: MagicMock,
-        queue,
+        timeout: float,
     ):
-        consume_broker = self.get_broker()
-
-        @consume_broker.subscriber(stream=StreamSub(queue, polling_interval=10))
-        async def handler(msg):
-            mock(msg)
-            event.set()
+        broker = self.get_broker(apply_types=True)
+        subscriber = broker.subscriber(list=queue)
 
-        async with self.patch_broker(consume_broker) as br:
+        async with self.patch_broker(broker) as br:
             await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br.publish("hello", stream=queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
-
-        mock.assert_called_once_with("hello")
+            mock(await subscriber.get_one(timeout=timeout))
+            mock.assert_called_once_with(None)
 
-    @pytest.mark.slow
-    async def test_consume_stream_native(
-        self,
-        event: asyncio.Event,
-        mock: MagicMock,
-        queue,
-    ):
-        consume_broker = self.get_broker()
+            await br.publish("test_message", list=queue)
 
-        @consume_broker.subscriber(stream=StreamSub(queue, polling_interval=10))
-        async def handler(msg):
-            mock(msg)
-            event.set()
+            message = await subscriber.get_one(timeout=timeout)
+            assert message is not None
+            assert await message.decode() == "test_message"
 
-        async with self.patch_broker(consume_broker) as br:
-            await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(
-                        br._connection.xadd(queue, {"message": "hello"})
-                    ),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+@pytest.mark.redis
+@pytest.mark.asyncio
+class TestConsumeStream:
+    def get_broker(self, apply_types: bool = False):
+        return RedisBroker(apply_types=apply_types)
 
-        mock.assert_called_once_with({"message": "hello"})
+    def patch_broker(self, broker):
+        return broker
 
     @pytest.mark.slow
-    async def test_consume_stream_batch(
+    @pytest.mark.parametrize(
+        ("batch", "publish", "expected"),
+        [
+            pytest.param(
+                False,
+                lambda br, queue: br.publish("hello", stream=queue),
+                "hello",
+                id="publish",
+            ),
+            pytest.param(
+                False,
+                lambda br, queue: br._connection.xadd(queue, {"message": "hello"}),
+                {"message": "hello"},
+                id="native",
+            ),
+            pytest.param(
+                True,
+                lambda br, queue: br.publish("hello", stream=queue),
+                ["hello"],
+                id="batch",
+            ),
+            pytest.param(
+                True,
+                lambda br, queue: br._connection.xadd(queue, {"message": "hello"}),
+                [{"message": "hello"}],
+                id="batch native",
+            ),
+        ],
+    )
+    async def test_consume_stream(
         self,
         event: asyncio.Event,
         mock: MagicMock,
-        queue,
+        queue: str,
+        batch: bool,
+        publish: Callable[[RedisBroker, str], Awaitable[Any]],
+        expected: Any,
     ):
         consume_broker = self.get_broker()
 
         @consume_broker.subscriber(
-            stream=StreamSub(queue, polling_interval=10, batch=True)
+            stream=StreamSub(queue, polling_interval=10, batch=batch)
         )
         async def handler(msg):
             mock(msg)
@@ -441,15 +499,10 @@ class TestConsumeStream:
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            await asyncio.wait(
-                (
-                    asyncio.create_task(br.publish("hello", stream=queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            await publish(br, queue)
+            await asyncio.wait_for(event.wait(), timeout=3)
 
-        mock.assert_called_once_with(["hello"])
+        mock.assert_called_once_with(expected)
 
     @pytest.mark.slow
     async def test_consume_stream_batch_headers(
@@ -477,15 +530,8 @@ class TestConsumeStream:
 
         async with self.patch_broker(consume_broker) as br:
             await br.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(
-                        br.publish("", stream=queue, headers={"custom": "1"})
-                    ),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
+            await br.publish("", stream=queue, headers={"custom": "1"})
+            await asyncio.wait_for(event.wait(), timeout=3)
 
             assert event.is_set()
             mock.assert_called_once_with(True)
@@ -502,56 +548,22 @@ class TestConsumeStream:
         class Data(BaseModel):
             m: str
 
-        msgs_queue = asyncio.Queue(maxsize=1)
+        result = asyncio.get_running_loop().create_future()
 
         @consume_broker.subscriber(
             stream=StreamSub(queue, polling_interval=10, batch=True)
         )
         async def handler(msg: List[Data]):
-            await msgs_queue.put(msg)
+            result.set_result(msg)
 
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
             await br.publish(Data(m="hi"), stream=queue)
 
-            result, _ = await asyncio.wait(
-                (asyncio.create_task(msgs_queue.get()),),
-                timeout=3,
-            )
-
-        assert next(iter(result)).result() == [Data(m="hi")]
-
-    @pytest.mark.slow
-    async def test_consume_stream_batch_native(
-        self,
-        event: asyncio.Event,
-        mock: MagicMock,
-        queue,
-    ):
-        consume_broker = self.get_broker()
-
-        @consume_broker.subscriber(
-            stream=StreamSub(queue, polling_interval=10, batch=True)
-        )
-        async def handler(msg):
-            mock(msg)
-            event.set()
+            msgs = await asyncio.wait_for(result, timeout=3)
 
-        async with self.patch_broker(consume_broker) as br:
-            await br.start()
-
-            await asyncio.wait(
-                (
-                    asyncio.create_task(
-                        br._connection.xadd(queue, {"message": "hello"})
-                    ),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
-            )
-
-        mock.assert_called_once_with([{"message": "hello"}])
+        assert msgs == [Data(m="hi")]
 
     async def test_consume_group(
         self,
@@ -559,12 +571,14 @@ class TestConsumeStream:
     ):
         consume_broker = self.get_broker()
 
-        @consume_broker.subscriber(
+        subscriber = consume_broker.subscriber(
             stream=StreamSub(queue, group="group", consumer=queue)
         )
+
+        @subscriber
         async def handler(msg: RedisMessage): ...
 
-        assert next(iter(consume_broker._subscribers.values())).last_id == "$"
+        assert subscriber.last_id == "$"
 
     async def test_consume_group_with_last_id(
         self,
@@ -572,17 +586,20 @@ class TestConsumeStream:
     ):
         consume_broker = self.get_broker()
 
-        @consume_broker.subscriber(
+        subscriber = consume_broker.subscriber(
             stream=StreamSub(queue, group="group", consumer=queue, last_id="0")
         )
+
+        @subscriber
         async def handler(msg: RedisMessage): ...
 
-        assert next(iter(consume_broker._subscribers.values())).last_id == "0"
+        assert subscriber.last_id == "0"
 
     async def test_consume_nack(
         self,
         queue: str,
         event: asyncio.Event,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         consume_broker = self.get_broker(apply_types=True)
 
@@ -596,16 +613,12 @@ class TestConsumeStream:
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            with patch.object(Redis, "xack", spy_decorator(Redis.xack)) as m:
-                await asyncio.wait(
-                    (
-                        asyncio.create_task(br.publish("hello", stream=queue)),
-                        asyncio.create_task(event.wait()),
-                    ),
-                    timeout=3,
-                )
+            xack = XackCounter(monkeypatch)
 
-                assert not m.mock.called
+            await br.publish("hello", stream=queue)
+            await asyncio.wait_for(event.wait(), timeout=3)
+
+            assert xack.calls == 0
 
         assert event.is_set()
 
@@ -613,6 +626,7 @@ class TestConsumeStream:
         self,
         queue: str,
         event: asyncio.Event,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         consume_broker = self.get_broker(apply_types=True)
 
@@ -625,16 +639,12 @@ class TestConsumeStream:
         async with self.patch_broker(consume_broker) as br:
             await br.start()
 
-            with patch.object(Redis, "xack", spy_decorator(Redis.xack)) as m:
-                await asyncio.wait(
-                    (
-                        asyncio.create_task(br.publish("hello", stream=queue)),
-                        asyncio.create_task(event.wait()),
-                    ),
-                    timeout=3,
-                )
+            xack = XackCounter(monkeypatch)
+
+            await br.publish("hello", stream=queue)
+            await asyncio.wait_for(event.wait(), timeout=3)
 
-                m.mock.assert_called_once()
+            assert xack.calls == 1
 
         assert event.is_set()
 
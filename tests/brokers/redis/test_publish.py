@@ -75,6 +75,21 @@ class TestPublish(BrokerPublishTestcase):
 
         assert {1, "hi"} == {r.result() for r in result}
 
+    async def test_list_publish_batch_by_one_request(
+        self,
+        queue: str,
+    ):
+        pub_broker = self.get_broker()
+
+        with patch.object(Redis, "rpush", spy_decorator(Redis.rpush)) as m:
+            async with self.patch_broker(pub_broker) as br:
+                await br.publish_batch(1, "hi", list=queue)
+
+        m.mock.assert_called_once()
+        _, name, *values = m.mock.call_args.args
+        assert name == queue
+        assert len(values) == 2
+
     async def test_batch_list_publisher(
         self,
         queue: str,
@@ -1,4 +1,6 @@
 import asyncio
+import sys
+from contextlib import suppress
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -19,6 +21,17 @@ def pytest_collection_modifyitems(items):
         item.add_marker("all")
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    if sys.platform not in ("win32", "cygwin", "cli"):
+        with suppress(ImportError):
+            import uvloop
+
+            return uvloop.EventLoopPolicy()
+
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture
 def queue():
     return str(uuid4())
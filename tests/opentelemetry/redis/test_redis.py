@@ -236,10 +236,11 @@ class TestConsumeWithTelemetry(TestConsume):
 
 @pytest.mark.redis
 class TestConsumeListWithTelemetry(TestConsumeList):
-    def get_broker(self, apply_types: bool = False):
+    def get_broker(self, apply_types: bool = False, **kwargs):
         return RedisBroker(
             middlewares=(RedisTelemetryMiddleware(),),
             apply_types=apply_types,
+            **kwargs,
         )
 
 